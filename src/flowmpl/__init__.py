@@ -8,11 +8,13 @@ Optional dependencies:
   pip install flowmpl[maps]    # geopandas + requests — for us_scatter_map
   pip install flowmpl[icons]   # pyconify + cairosvg — for fetch_icon
   pip install flowmpl[gemini]  # google-genai — for generate_illustration
+  pip install flowmpl[fast]    # numba — JIT series downsampling and edge routing
   pip install flowmpl[all]     # all optional deps
 """
 
 from flowmpl.charts import (
     annotated_series,
+    clear_figure_cache,
     horizontal_bar_ranking,
     multi_panel,
     stacked_bar,
@@ -55,6 +57,7 @@ from flowmpl.export import (
     TARGETS,
     ExportTarget,
     export,
+    fast_png,
     figure_info,
     list_targets,
 )
@@ -88,15 +91,21 @@ from flowmpl.illustrations import (
     generate_illustrations,
     remove_background,
 )
-from flowmpl.maps import us_scatter_map
+from flowmpl.maps import make_legend_spec, us_scatter_map, us_scatter_maps
 from flowmpl.palettes import (
     CATEGORICAL,
+    CATEGORICAL_RGBA,
     COMPANY_COLORS,
     COMPANY_LABELS,
+    COMPANY_RGBA,
     FUEL_COLORS,
+    FUEL_RGBA,
     company_color,
+    company_colors_for,
     company_label,
+    company_labels_for,
     fuel_color,
+    fuel_colors_for,
 )
 
 __all__ = [
@@ -120,12 +129,18 @@ __all__ = [
     "RULE",
     # Palettes
     "CATEGORICAL",
+    "CATEGORICAL_RGBA",
     "COMPANY_COLORS",
     "COMPANY_LABELS",
+    "COMPANY_RGBA",
     "FUEL_COLORS",
+    "FUEL_RGBA",
     "company_color",
+    "company_colors_for",
     "company_label",
+    "company_labels_for",
     "fuel_color",
+    "fuel_colors_for",
     # Helpers
     "add_brand_mark",
     "add_rule",
@@ -139,6 +154,7 @@ __all__ = [
     "reference_line",
     # Charts
     "annotated_series",
+    "clear_figure_cache",
     "horizontal_bar_ranking",
     "multi_panel",
     "stacked_bar",
@@ -153,7 +169,9 @@ __all__ = [
     "strip_plot",
     "surplus_deficit_line",
     # Maps
+    "make_legend_spec",
     "us_scatter_map",
+    "us_scatter_maps",
     # Illustrations
     "generate_illustration",
     "generate_illustrations",
@@ -180,6 +198,7 @@ __all__ = [
     "CHART_SCENE_LAYOUT",
     # Export
     "export",
+    "fast_png",
     "ExportTarget",
     "TARGETS",
     "list_targets",
@@ -4,23 +4,397 @@ All functions return matplotlib Figure objects. Call save_fig() (from your
 notebook setup module) to persist them, and display via mo.image() in Marimo.
 
 Optional dependency: pandas>=2.0 (required by all functions in this module).
+Optional dependency: numba>=0.59 (JIT-compiles the long-series downsampler).
 """
 
 from __future__ import annotations
 
+import datetime
+import functools
+import hashlib
+import inspect
+import pickle
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import matplotlib as mpl
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 
 from flowmpl.design import COLORS, FIGSIZE, FONTS, PAPER
 from flowmpl.helpers import chart_title, legend_below
 from flowmpl.palettes import CATEGORICAL
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pandas as pd
+
+# Rendered figures, pickled, keyed by a fingerprint of the call. Notebooks
+# re-run chart cells on every small parameter tweak; a hit skips the whole
+# artist build and returns a fresh unpickled copy the caller may mutate.
+# A figure is only pickled the second time its key is seen, so one-off
+# renders never pay for serialisation.
+_FIGURE_CACHE: OrderedDict[bytes, bytes] = OrderedDict()
+_FIGURE_CACHE_SIZE = 32
+_FIGURE_CACHE_MAX_BYTES = 64 << 20
+_FIGURE_CACHE_SEEN: OrderedDict[bytes, None] = OrderedDict()
+
+# rcParams groups that affect how these charts are built; backend, savefig,
+# keymap and other-artist settings can't change a cached figure.
+_RC_GROUPS = frozenset({
+    "axes", "date", "figure", "font", "grid", "hatch", "legend", "lines", "patch",
+    "path", "text", "timezone", "xaxis", "xtick", "yaxis", "ytick",
+})
+_RC_KEYS = tuple(sorted(k for k in mpl.rcParams if k.split(".", 1)[0] in _RC_GROUPS))
+
+
+def _rc_fingerprint() -> bytes:
+    """Digest of the rcParams the charts read (style, fonts, DPI, ...)."""
+    rc = mpl.rcParams
+    # dict.__getitem__ skips RcParams' per-key validation wrapper.
+    values = [dict.__getitem__(rc, k) for k in _RC_KEYS]
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).digest()
+
+
+# Argument leaves whose repr is exact and short enough to key on.
+_REPR_KEY_TYPES = (str, bytes, int, float, complex, bool, type(None), np.generic,
+                   datetime.date, datetime.timedelta)
+
+
+def _hash_argument(h: hashlib.blake2b, obj: object) -> None:
+    """Feed *obj* into *h*; raise TypeError for values that can't be keyed.
+
+    Arrays are hashed by their bytes because NumPy truncates long reprs, and
+    arbitrary objects are rejected rather than trusted to have a faithful repr.
+    """
+    if isinstance(obj, _REPR_KEY_TYPES):
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError("object arrays are not hashable")
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}:{len(obj)}(".encode())
+        for item in obj:
+            _hash_argument(h, item)
+        h.update(b")")
+    elif isinstance(obj, dict):
+        h.update(f"dict:{len(obj)}(".encode())
+        for key, value in obj.items():
+            _hash_argument(h, key)
+            _hash_argument(h, value)
+        h.update(b")")
+    else:
+        raise TypeError(f"cannot key a chart call on {type(obj).__name__}")
+
+
+def _call_fingerprint(df: pd.DataFrame, columns: list, arguments: dict) -> bytes:
+    """Hash a chart call: the plotted columns, the other arguments and rcParams."""
     import pandas as pd
 
+    data = df[columns]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    h.update(repr((tuple(data.columns), tuple(map(str, data.dtypes)))).encode())
+    h.update(repr(df.index.dtype).encode())
+    _hash_argument(h, arguments)
+    h.update(_rc_fingerprint())
+    return h.digest()
+
+
+def _cached_figure(
+    used_columns: Callable[[dict], list],
+) -> Callable[[Callable[..., plt.Figure]], Callable[..., plt.Figure]]:
+    """Memoize a ``func(df, ...)`` chart builder in the bounded figure cache.
+
+    *used_columns* maps the call's bound arguments (without ``df``) to the
+    frame columns the chart reads; only those and the index are hashed.
+    Calls that can't be keyed (unknown columns, unhashable cells or
+    arguments) are built without the cache.
+    """
+
+    def decorator(func: Callable[..., plt.Figure]) -> Callable[..., plt.Figure]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(df: pd.DataFrame, *args, **kwargs) -> plt.Figure:
+            try:
+                bound = signature.bind(df, *args, **kwargs)
+                arguments = dict(bound.arguments)
+                del arguments[next(iter(signature.parameters))]
+                columns = list(dict.fromkeys(used_columns(arguments)))
+                key = func.__name__.encode() + _call_fingerprint(df, columns, arguments)
+            except (TypeError, KeyError, ValueError, AttributeError):
+                return func(df, *args, **kwargs)
+            return _cached_call(key, func, df, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _cached_call(
+    key: bytes, func: Callable[..., plt.Figure], df: pd.DataFrame, args: tuple, kwargs: dict
+) -> plt.Figure:
+    """Return the cached figure for *key*, building it on a miss.
+
+    A miss only stores the figure if *key* has missed before; the cache is
+    bounded both by entry count and by total pickled size.
+    """
+    payload = _FIGURE_CACHE.get(key)
+    if payload is not None:
+        _FIGURE_CACHE.move_to_end(key)
+        return pickle.loads(payload)
+    fig = func(df, *args, **kwargs)
+    if key not in _FIGURE_CACHE_SEEN:
+        _FIGURE_CACHE_SEEN[key] = None
+        if len(_FIGURE_CACHE_SEEN) > 4 * _FIGURE_CACHE_SIZE:
+            _FIGURE_CACHE_SEEN.popitem(last=False)
+        return fig
+    del _FIGURE_CACHE_SEEN[key]
+    payload = pickle.dumps(fig)
+    if len(payload) > _FIGURE_CACHE_MAX_BYTES:
+        return fig
+    _FIGURE_CACHE[key] = payload
+    total = sum(map(len, _FIGURE_CACHE.values()))
+    while len(_FIGURE_CACHE) > _FIGURE_CACHE_SIZE or total > _FIGURE_CACHE_MAX_BYTES:
+        total -= len(_FIGURE_CACHE.popitem(last=False)[1])
+    return fig
+
+
+def clear_figure_cache() -> None:
+    """Drop every figure memoized by :func:`annotated_series` and :func:`multi_panel`."""
+    _FIGURE_CACHE.clear()
+    _FIGURE_CACHE_SEEN.clear()
+
+
+# A Path takes its simplification settings from rcParams when it is created,
+# so this only needs to be active while a chart builds its artists; a coarser
+# threshold merges sub-pixel segments that dense series produce. It covers the
+# LineCollection series, whose paths are built here. The ax.plot fallback is
+# not covered: Line2D rebuilds its path at draw time, outside this context,
+# with the caller's rcParams.
+_FAST_PATH_RC = {"path.simplify": True, "path.simplify_threshold": 1.0}
+
+
+def _fast_paths(func: Callable[..., plt.Figure]) -> Callable[..., plt.Figure]:
+    """Build the figure under :data:`_FAST_PATH_RC`."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> plt.Figure:
+        with plt.style.context(_FAST_PATH_RC):
+            return func(*args, **kwargs)
+
+    return wrapper
+
 
+@functools.lru_cache(maxsize=16)
+def _figure_template(nrows: int, ncols: int, figsize: tuple, rc: bytes) -> bytes:
+    """Pickle a blank constrained-layout subplot grid; *rc* only keys the cache."""
+    fig, _ = plt.subplots(nrows, ncols, figsize=figsize, layout="constrained")
+    try:
+        return pickle.dumps(fig)
+    finally:
+        plt.close(fig)
+
+
+def _subplots(
+    nrows: int = 1, ncols: int = 1, *, figsize: tuple[float, float]
+) -> tuple[plt.Figure, np.ndarray]:
+    """``plt.subplots(..., squeeze=False, layout="constrained")`` from a template.
+
+    Unpickling a blank figure skips building the Axes, spines and ticks,
+    roughly halving figure creation time. Templates are keyed by the active
+    rcParams so ``apply_style()`` or a style context never sees a stale one.
+    """
+    payload = _figure_template(nrows, ncols, tuple(figsize), _rc_fingerprint())
+    fig = pickle.loads(payload)
+    return fig, np.asarray(fig.axes, dtype=object).reshape(nrows, ncols)
+
+
+# Shared by every annotated_series callout. Matplotlib copies both before
+# use; they stay plain dicts because Annotation keeps a reference to its
+# arrowprops and figures must remain picklable for the caches above.
+_ANNOTATION_ARROW = {"facecolor": "black", "shrink": 0.05, "width": 1, "headwidth": 5}
+_ANNOTATION_BBOX = {"boxstyle": "round,pad=0.3", "fc": PAPER, "ec": "black", "alpha": 0.8}
+
+
+# Line styles a single LineCollection can reproduce; anything else (markers,
+# drawstyles, ...) falls back to one ax.plot per series.
+_COLLECTION_STYLE_KEYS = frozenset({"color", "label", "linewidth", "linestyle", "alpha"})
+
+
+def _lttb_indices_loop(x: np.ndarray, ys: np.ndarray, n_out: int) -> np.ndarray:
+    """Scalar-loop LTTB with the same contract as :func:`_lttb_indices`.
+
+    Only worth running once compiled by Numba; see :func:`_lttb_kernel`.
+    """
+    n_series, t = ys.shape
+    edges = np.empty(n_out, dtype=np.intp)
+    for i in range(n_out - 1):
+        edges[i] = 1 + (i * (t - 2)) // (n_out - 2)
+    edges[n_out - 1] = t
+    out = np.empty((n_series, n_out), dtype=np.intp)
+    for r in range(n_series):
+        out[r, 0] = 0
+        out[r, n_out - 1] = t - 1
+        a = 0
+        for i in range(n_out - 2):
+            lo, hi, nxt = edges[i], edges[i + 1], edges[i + 2]
+            cx = 0.0
+            cy = 0.0
+            for j in range(hi, nxt):
+                cx += x[j]
+                cy += ys[r, j]
+            cx /= nxt - hi
+            cy /= nxt - hi
+            best, best_area = lo, -1.0
+            for j in range(lo, hi):
+                area = abs(
+                    (x[a] - cx) * (ys[r, j] - ys[r, a])
+                    - (x[a] - x[j]) * (cy - ys[r, a])
+                )
+                if area > best_area:
+                    best, best_area = j, area
+            a = best
+            out[r, i + 1] = a
+    return out
+
+
+@functools.cache
+def _lttb_kernel() -> Callable[[np.ndarray, np.ndarray, int], np.ndarray] | None:
+    """Compile :func:`_lttb_indices_loop` with Numba, or None if it is not installed."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, fastmath=True)(_lttb_indices_loop)
+
+
+def _lttb_indices(x: np.ndarray, ys: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets point selection for each row of *ys*.
+
+    Parameters
+    ----------
+    x : ndarray, shape (T,)
+        Shared, sorted x positions.
+    ys : ndarray, shape (N, T)
+        One series per row, no NaNs.
+    n_out : int
+        Points to keep per series (first and last are always kept).
+
+    Returns
+    -------
+    ndarray of int, shape (N, n_out)
+        Indices into the T axis, increasing along each row.
+    """
+    kernel = _lttb_kernel()
+    if kernel is not None:
+        return kernel(np.ascontiguousarray(x), np.ascontiguousarray(ys), n_out)
+
+    n_series, t = ys.shape
+    # Integer bucket edges, identical to the loop kernel's.
+    edges = np.empty(n_out, dtype=np.intp)
+    edges[:-1] = 1 + (np.arange(n_out - 1) * (t - 2)) // (n_out - 2)
+    edges[-1] = t
+    rows = np.arange(n_series)
+    out = np.empty((n_series, n_out), dtype=np.intp)
+    out[:, 0] = 0
+    out[:, -1] = t - 1
+    a = out[:, 0].copy()
+
+    # The bucket loop is inherently sequential (each pick depends on the
+    # previous one), but every series is handled at once per bucket.
+    for i in range(n_out - 2):
+        lo, hi, nxt = edges[i], edges[i + 1], edges[i + 2]
+        cx = x[hi:nxt].mean()
+        cy = ys[:, hi:nxt].mean(axis=1)
+        ax_, ay = x[a][:, None], ys[rows, a][:, None]
+        area = np.abs(
+            (ax_ - cx) * (ys[:, lo:hi] - ay) - (ax_ - x[lo:hi]) * (cy[:, None] - ay)
+        )
+        a = lo + area.argmax(axis=1)
+        out[:, i + 1] = a
+    return out
+
+
+def _index_positions(index: pd.Index) -> np.ndarray:
+    """Convert *index* to x positions once: float days for datetimes, raw values otherwise."""
+    if index.dtype.kind == "M":
+        return mdates.date2num(index)
+    return index.to_numpy()
+
+
+def _add_line_collection(
+    ax: plt.Axes, x: np.ndarray, df: pd.DataFrame, columns: dict[str, dict]
+) -> list[Line2D] | None:
+    """Draw every series in *columns* as one LineCollection.
+
+    Series longer than twice the figure's pixel width are thinned with
+    LTTB first; the extra points could not be seen anyway.
+
+    Returns proxy Line2D handles for the labelled series, or None (drawing
+    nothing) when the index or a style cannot be expressed as a collection.
+    """
+    styles = list(columns.values())
+    if x.dtype.kind not in "iuf":
+        return None
+    if not all(_COLLECTION_STYLE_KEYS.issuperset(s) for s in styles):
+        return None
+    x = x.astype(np.float64, copy=False)
+
+    ys = df[list(columns)].to_numpy(dtype=np.float64).T
+    n_max = int(2 * ax.figure.get_figwidth() * ax.figure.dpi)
+    if (
+        ys.shape[1] > n_max
+        and df.index.is_monotonic_increasing
+        and np.isfinite(ys).all()
+    ):
+        idx = _lttb_indices(x, ys, n_max)
+        xs, ys = x[idx], np.take_along_axis(ys, idx, axis=1)
+    else:
+        xs = np.broadcast_to(x, ys.shape)
+    segments = np.stack((xs, ys), axis=-1)
+
+    # Like ax.plot, only series without an explicit color advance the cycle.
+    cycle = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+    auto = iter(np.cumsum([("color" not in s) for s in styles]) - 1)
+    colors = [
+        to_rgba(s["color"] if "color" in s else cycle[k % len(cycle)], s.get("alpha"))
+        for s, k in zip(styles, auto)
+    ]
+    widths = [s.get("linewidth", plt.rcParams["lines.linewidth"]) for s in styles]
+    linestyles = [s.get("linestyle", "solid") for s in styles]
+    ax.add_collection(
+        LineCollection(segments, colors=colors, linewidths=widths, linestyles=linestyles)
+    )
+    ax.autoscale_view()
+
+    return [
+        Line2D([], [], color=c, linewidth=w, linestyle=ls, label=s["label"])
+        for s, c, w, ls in zip(styles, colors, widths, linestyles)
+        if not str(s.get("label", "_")).startswith("_")
+    ]
+
+
+def _annotated_series_columns(arguments: dict) -> list:
+    """Frame columns an :func:`annotated_series` call reads."""
+    return [*arguments["columns"], *(arguments.get("fill_between") or ())]
+
+
+def _multi_panel_columns(arguments: dict) -> list:
+    """Frame columns a :func:`multi_panel` call reads."""
+    return [col for panel in arguments["panels"] for col in panel["columns"]]
+
+
+@_cached_figure(_annotated_series_columns)
+@_fast_paths
 def annotated_series(
     df: pd.DataFrame,
     columns: dict[str, dict],
@@ -58,41 +432,51 @@ def annotated_series(
     Returns
     -------
     matplotlib.figure.Figure
+
+    Notes
+    -----
+    Results are memoized on the contents of *df* and the remaining
+    arguments; see :func:`clear_figure_cache`.
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, axes = _subplots(figsize=figsize)
+    ax = axes[0, 0]
+    x = _index_positions(df.index)
+    if df.index.dtype.kind == "M":
+        ax.xaxis_date(df.index.tz)
 
-    for col, style in columns.items():
-        ax.plot(df.index, df[col], **style)
+    handles = _add_line_collection(ax, x, df, columns)
+    if handles is None:
+        for col, style in columns.items():
+            ax.plot(x, df[col].to_numpy(), **style)
 
     if fill_between:
         upper, lower = fill_between
-        ax.fill_between(df.index, df[upper], df[lower], color="gray", alpha=0.1)
+        ax.fill_between(x, df[upper].to_numpy(), df[lower].to_numpy(),
+                        color="gray", alpha=0.1)
 
     if annotations:
+        annotation_fs = FONTS["annotation"]
         for text, date, y_val, arrow_pos in annotations:
             ax.annotate(
                 text,
                 xy=(date, y_val),
                 xytext=arrow_pos,
-                arrowprops=dict(
-                    facecolor="black", shrink=0.05, width=1, headwidth=5
-                ),
-                fontsize=FONTS["annotation"],
+                arrowprops=_ANNOTATION_ARROW,
+                fontsize=annotation_fs,
                 fontweight="bold",
-                bbox=dict(
-                    boxstyle="round,pad=0.3", fc=PAPER, ec="black", alpha=0.8
-                ),
+                bbox=_ANNOTATION_BBOX,
             )
 
     ax.set_ylabel(ylabel, fontsize=FONTS["axis_label"])
     if grid:
         ax.grid(True, linestyle=":", alpha=0.6)
-    plt.tight_layout()
-    legend_below(ax)
+    legend_below(ax, handles=handles)
     chart_title(fig, title)
     return fig
 
 
+@_cached_figure(_multi_panel_columns)
+@_fast_paths
 def multi_panel(
     df: pd.DataFrame,
     panels: list[dict],
@@ -123,35 +507,52 @@ def multi_panel(
     Returns
     -------
     matplotlib.figure.Figure
+
+    Notes
+    -----
+    Results are memoized like :func:`annotated_series`.
     """
     nrows = int(np.ceil(len(panels) / ncols))
     if figsize is None:
         figsize = (6 * ncols, 4 * nrows)
 
-    fig, axes = plt.subplots(nrows, ncols, figsize=figsize, squeeze=False)
+    fig, axes = _subplots(nrows, ncols, figsize=figsize)
+    title_fs = FONTS["panel_title"]
+    label_fs = FONTS["axis_label"]
+    legend_fs = FONTS["legend"]
+    x = _index_positions(df.index)
+    is_date = df.index.dtype.kind == "M"
 
     for idx, panel in enumerate(panels):
         row, col = divmod(idx, ncols)
         ax = axes[row, col]
-
-        for column, style in panel["columns"].items():
-            ax.plot(df.index, df[column], **style)
-
-        ax.set_title(panel.get("title", ""), fontsize=FONTS["panel_title"])
-        ax.set_ylabel(panel.get("ylabel", ""), fontsize=FONTS["axis_label"])
+        columns = panel["columns"]
+        if is_date:
+            ax.xaxis_date(df.index.tz)
+
+        # loc="best" only hit-tests Line2D paths (a LineCollection counts just
+        # its offsets), so panels with a legend keep one Line2D per series.
+        has_legend = any("label" in s for s in columns.values())
+        if has_legend or _add_line_collection(ax, x, df, columns) is None:
+            arr = df[list(columns)].to_numpy()
+            for j, style in enumerate(columns.values()):
+                ax.plot(x, arr[:, j], **style)
+
+        ax.set_title(panel.get("title", ""), fontsize=title_fs)
+        ax.set_ylabel(panel.get("ylabel", ""), fontsize=label_fs)
         if "ylim" in panel:
             ax.set_ylim(panel["ylim"])
-        if any("label" in s for s in panel["columns"].values()):
-            ax.legend(fontsize=FONTS["legend"])
+        if has_legend:
+            ax.legend(fontsize=legend_fs)
 
     for idx in range(len(panels), nrows * ncols):
         row, col = divmod(idx, ncols)
         axes[row, col].set_visible(False)
-    plt.tight_layout()
     chart_title(fig, suptitle)
     return fig
 
 
+@_fast_paths
 def stacked_bar(
     df: pd.DataFrame,
     x_col: str,
@@ -169,7 +570,8 @@ def stacked_bar(
     df : DataFrame
         Source data.
     x_col : str
-        Column to use for x-axis categories.
+        Column to use for x-axis categories. Categorical dtype is accepted
+        and is the most compact choice for long frames of repeated labels.
     stack_cols : dict
         Mapping of column name -> style kwargs (must include 'color', 'label').
     title : str
@@ -183,29 +585,35 @@ def stacked_bar(
     -------
     matplotlib.figure.Figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, axes = _subplots(figsize=figsize)
+    ax = axes[0, 0]
     x = np.arange(len(df[x_col]))
     width = 0.7
-    bottom = np.zeros(len(x))
+    cols = list(stack_cols)
+    vals = df[cols].to_numpy(dtype=np.float64)
+    bottoms = np.empty_like(vals)
+    bottoms[:, 0] = 0.0
+    np.cumsum(vals[:, :-1], axis=1, out=bottoms[:, 1:])
 
-    for col, style in stack_cols.items():
-        style = style.copy()
-        color = style.pop("color", None)
-        label = style.pop("label", col)
-        values = df[col].values.astype(float)
-        ax.bar(x, values, width, bottom=bottom, color=color, label=label, **style)
-        bottom += values
+    for j, (col, style) in enumerate(stack_cols.items()):
+        extra = {k: v for k, v in style.items() if k not in ("color", "label")}
+        ax.bar(x, vals[:, j], width, bottom=bottoms[:, j],
+               color=style.get("color"), label=style.get("label", col), **extra)
 
     ax.set_xticks(x)
     _ha = "right" if rotation else "center"
-    ax.set_xticklabels(df[x_col], rotation=rotation, ha=_ha)
+    # Stringify each distinct category once; repeated labels (regions,
+    # products, ...) then only cost an index lookup.
+    codes, uniques = df[x_col].factorize(use_na_sentinel=False)
+    tick_labels = uniques.astype(str).to_numpy()[codes].tolist()
+    ax.set_xticklabels(tick_labels, rotation=rotation, ha=_ha)
     ax.set_ylabel(ylabel, fontsize=FONTS["axis_label"])
-    plt.tight_layout()
     legend_below(ax)
     chart_title(fig, title)
     return fig
 
 
+@_fast_paths
 def waterfall_chart(
     items: list[tuple[str, float]],
     title: str,
@@ -235,68 +643,68 @@ def waterfall_chart(
     matplotlib.figure.Figure
     """
     labels = [label for label, _ in items] + [total_label]
-    values = [value for _, value in items]
-    total = sum(values)
-
-    cumulative = np.zeros(len(values) + 1)
-    for i, v in enumerate(values):
-        cumulative[i + 1] = cumulative[i] + v
-
-    bottoms = np.zeros(len(labels))
-    heights = np.zeros(len(labels))
-    colors = []
-
-    for i, v in enumerate(values):
-        if v >= 0:
-            bottoms[i] = cumulative[i]
-            heights[i] = v
-            colors.append(positive_color)
-        else:
-            bottoms[i] = cumulative[i + 1]
-            heights[i] = abs(v)
-            colors.append(negative_color)
-
-    bottoms[-1] = 0
+    values = np.asarray([value for _, value in items], dtype=np.float64)
+    n = len(values)
+
+    # Every slot is written below, so skip zero-initialising the buffers.
+    cumulative = np.empty(n + 1)
+    cumulative[0] = 0.0
+    np.cumsum(values, out=cumulative[1:])
+    total = cumulative[-1]
+
+    pos = values >= 0
+    bottoms = np.empty(n + 1)
+    bottoms[:-1] = np.where(pos, cumulative[:-1], cumulative[1:])
+    bottoms[-1] = 0.0
+    heights = np.empty(n + 1)
+    np.abs(values, out=heights[:-1])
     heights[-1] = total
-    colors.append(total_color)
+    colors = [positive_color if p else negative_color for p in pos.tolist()] + [total_color]
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, axes = _subplots(figsize=figsize)
+    ax = axes[0, 0]
     x = np.arange(len(labels))
-    ax.bar(x, heights, bottom=bottoms, color=colors, width=0.6, edgecolor="white")
-
-    for i, (b, h) in enumerate(zip(bottoms, heights)):
-        val = values[i] if i < len(values) else total
-        label = f"${val:,.1f}B" if abs(val) >= 1 else f"${val * 1000:,.0f}M"
-        ax.text(i, b + h + total * 0.01, label, ha="center", va="bottom",
-                fontsize=FONTS["value_label"])
-
-    for i in range(len(values)):
-        ax.plot(
-            [i + 0.3, i + 0.7],
-            [cumulative[i + 1], cumulative[i + 1]],
-            color="gray",
-            linewidth=0.8,
-            linestyle="--",
-        )
+    bars = ax.bar(x, heights, bottom=bottoms, color=colors, width=0.6,
+                  edgecolor="white")
+
+    bar_values = np.append(values, total)
+    value_labels = [
+        f"${v:,.1f}B" if abs(v) >= 1 else f"${v * 1000:,.0f}M" for v in bar_values
+    ]
+    ax.bar_label(bars, labels=value_labels, padding=3,
+                 fontsize=FONTS["value_label"])
+
+    # Dashed connectors from each bar's running total to the next bar.
+    steps = np.arange(len(values))
+    connectors = np.stack(
+        (
+            np.column_stack((steps + 0.3, cumulative[1:])),
+            np.column_stack((steps + 0.7, cumulative[1:])),
+        ),
+        axis=1,
+    )
+    ax.add_collection(
+        LineCollection(connectors, colors="gray", linewidths=0.8, linestyles="--")
+    )
 
     ax.set_xticks(x)
     ax.set_xticklabels(labels, rotation=30, ha="right",
                        fontsize=FONTS["tick_label"])
     ax.set_ylabel("$ Billions", fontsize=FONTS["axis_label"])
-    plt.tight_layout()
     chart_title(fig, title)
     return fig
 
 
+@_fast_paths
 def horizontal_bar_ranking(
     labels: list[str],
-    values: list[float],
+    values: list[float] | np.ndarray,
     title: str,
     *,
     xlabel: str = "",
     color: str | list[str] = CATEGORICAL[0],
     figsize: tuple[float, float] = FIGSIZE["tall"],
-    highlight_indices: list[int] | None = None,
+    highlight_indices: list[int] | np.ndarray | None = None,
     highlight_color: str = COLORS["accent"],
 ) -> plt.Figure:
     """Horizontal bar chart for ranking comparisons.
@@ -305,7 +713,7 @@ def horizontal_bar_ranking(
     ----------
     labels : list of str
         Category labels (displayed on y-axis).
-    values : list of float
+    values : list of float or ndarray
         Values for each category.
     title : str
         Insight-driven chart title.
@@ -315,8 +723,9 @@ def horizontal_bar_ranking(
         Bar color(s).
     figsize : tuple
         Figure size.
-    highlight_indices : list of int, optional
-        Indices to highlight in a different color.
+    highlight_indices : list of int or ndarray, optional
+        Indices to highlight in a different color. Out-of-range indices
+        are ignored.
     highlight_color : str
         Color for highlighted bars.
 
@@ -324,30 +733,34 @@ def horizontal_bar_ranking(
     -------
     matplotlib.figure.Figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
-    y = np.arange(len(labels))
+    fig, axes = _subplots(figsize=figsize)
+    ax = axes[0, 0]
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    y = np.arange(n)
 
     if isinstance(color, str):
-        colors = [color] * len(labels)
+        colors = np.full(n, color, dtype=object)
     else:
-        colors = list(color)
+        # Filled element-wise so RGB(A) tuples stay whole instead of
+        # becoming a 2-D array.
+        color = list(color)
+        colors = np.empty(len(color), dtype=object)
+        colors[:] = color
 
-    if highlight_indices:
-        for idx in highlight_indices:
-            if 0 <= idx < len(colors):
-                colors[idx] = highlight_color
+    if highlight_indices is not None and len(highlight_indices):
+        idx = np.asarray(highlight_indices, dtype=np.intp)
+        colors[idx[(idx >= 0) & (idx < len(colors))]] = highlight_color
 
-    ax.barh(y, values, color=colors, height=0.6)
+    bars = ax.barh(y, values, color=colors.tolist(), height=0.6)
     ax.set_yticks(y)
-    ax.set_yticklabels(labels)
+    ax.set_yticklabels([str(label) for label in labels])
     ax.set_xlabel(xlabel, fontsize=FONTS["axis_label"])
     ax.invert_yaxis()
-    ax.set_ylim(len(labels) - 0.5, -0.5)  # tight: half a bar of padding top/bottom
+    ax.set_ylim(n - 0.5, -0.5)  # tight: half a bar of padding top/bottom
 
-    for i, v in enumerate(values):
-        ax.text(v + max(values) * 0.01, i, f"{v:,.0f}", va="center",
-                fontsize=FONTS["value_label"])
+    ax.bar_label(bars, labels=[f"{v:,.0f}" for v in values], padding=3,
+                 fontsize=FONTS["value_label"])
 
-    plt.tight_layout()
     chart_title(fig, title)
     return fig
@@ -3,11 +3,19 @@
 Single source of truth for all visual decisions. Import these into every
 chart module and notebook; never hardcode hex colors, font sizes, or figure
 dimensions as magic numbers.
+
+The token tables are read-only mappings; copy one (``dict(FONTS)``) to
+derive a variant instead of editing the shared table in place.
 """
 
 from __future__ import annotations
 
 from importlib.resources import as_file, files
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 def apply_style() -> None:
@@ -32,7 +40,7 @@ def apply_style() -> None:
 # Semantic role colors
 # ───────────────────────────────────────────────────────────────────────────
 
-COLORS: dict[str, str] = {
+COLORS: Mapping[str, str] = MappingProxyType({
     "positive":   "#228833",   # growth, increase, good (Paul Tol green)
     "negative":   "#EE6677",   # decline, decrease, bad  (Paul Tol red)
     "neutral":    "#888888",   # neither good nor bad
@@ -43,7 +51,7 @@ COLORS: dict[str, str] = {
     "text_light": "#666666",   # secondary text, annotations
     "background": "#f5f1eb",   # map fills, chart backgrounds (matches --paper on site)
     "grid":       "#d6cfc7",   # gridlines (matches --rule on site)
-}
+})
 
 # ── Site identity tokens — 1:1 with CSS variables on the published site ───────
 # These map directly to the CSS custom properties in the site's stylesheet.
@@ -70,7 +78,7 @@ CONTEXT: str = "#c0c0c0"
 # Typography — font sizes by role
 # ───────────────────────────────────────────────────────────────────────────
 
-FONTS: dict[str, int] = {
+FONTS: Mapping[str, int] = MappingProxyType({
     "axis_label":  15,   # xlabel, ylabel
     "tick_label":  14,   # xticklabels, yticklabels
     "annotation":  14,   # arrow annotations, callout text
@@ -80,7 +88,7 @@ FONTS: dict[str, int] = {
     "suptitle":    16,   # figure suptitle
     "caption":     11,   # figure captions, source notes
     "small":       11,   # small annotations, dense charts
-}
+})
 
 # Standard font sizes for flow_diagram() — consistent text appearance
 # across all notebooks when displayed at width=850 px.
@@ -92,7 +100,7 @@ FLOW_EDGE_FONT_SIZE: int = 16
 # Figure size presets
 # ───────────────────────────────────────────────────────────────────────────
 
-FIGSIZE: dict[str, tuple[float, float]] = {
+FIGSIZE: Mapping[str, tuple[float, float]] = MappingProxyType({
     "single":    (10, 5),   # default for most charts
     "wide":      (12, 5),   # time series, many categories
     "tall":      (10, 7),   # vertical bar rankings
@@ -101,26 +109,26 @@ FIGSIZE: dict[str, tuple[float, float]] = {
     "dashboard": (14, 8),   # 2×2 panel grids
     "map":       (12, 7),   # US scatter maps
     "large":     (16, 9),   # complex multi-panel
-}
+})
 
 
 # ───────────────────────────────────────────────────────────────────────────
 # Element defaults — consistent bar / scatter / legend styling
 # ───────────────────────────────────────────────────────────────────────────
 
-BAR_DEFAULTS: dict[str, object] = {
+BAR_DEFAULTS: Mapping[str, object] = MappingProxyType({
     "alpha":      0.85,
     "edgecolor":  "white",
     "linewidth":  0.5,
-}
+})
 
-SCATTER_DEFAULTS: dict[str, object] = {
+SCATTER_DEFAULTS: Mapping[str, object] = MappingProxyType({
     "alpha":      0.6,
     "edgecolors": "white",
     "linewidth":  0.5,
-}
+})
 
-LEGEND_DEFAULTS: dict[str, object] = {
+LEGEND_DEFAULTS: Mapping[str, object] = MappingProxyType({
     "handlelength": 1.5,
     "handleheight": 1.5,
-}
+})
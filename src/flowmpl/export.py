@@ -8,6 +8,7 @@ Optional dependency: Pillow>=9.0 (required only for CMYK raster conversion).
 
 from __future__ import annotations
 
+import io
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -355,3 +356,42 @@ def figure_info(fig: plt.Figure) -> dict:
         "width_px": int(round(w * dpi)),
         "height_px": int(round(h * dpi)),
     }
+
+
+def fast_png(fig: plt.Figure, *, compress_level: int = 1) -> bytes:
+    """Rasterize a figure to PNG bytes straight from the Agg buffer.
+
+    Skips ``savefig``'s bbox and metadata handling and encodes with Pillow at
+    a low zlib level, which is much faster than the default for notebook
+    display (e.g. ``mo.image(fast_png(fig))``). Use :func:`export` for files.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        The figure to render at its own size and DPI.
+    compress_level : int
+        zlib level 0-9 passed to Pillow. Default 1.
+
+    Returns
+    -------
+    bytes
+        PNG-encoded RGBA image.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from PIL import Image  # hard dependency of matplotlib
+
+    original = fig.canvas
+    # Non-Agg canvases (e.g. a vector backend) render through a temporary
+    # Agg canvas; the figure is handed back to its own canvas afterwards.
+    canvas = original if hasattr(original, "buffer_rgba") else FigureCanvasAgg(fig)
+    try:
+        canvas.draw()
+        img = Image.frombuffer(
+            "RGBA", canvas.get_width_height(physical=True), canvas.buffer_rgba(),
+            "raw", "RGBA", 0, 1,
+        ).copy()
+    finally:
+        fig.set_canvas(original)
+    out = io.BytesIO()
+    img.save(out, format="PNG", compress_level=compress_level)
+    return out.getvalue()
@@ -16,13 +16,176 @@ symmetrically along that face to avoid arrowhead stacking.
 
 from __future__ import annotations
 
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
+
+import matplotlib as mpl
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties, findfont
 
 from flowmpl.design import COLORS, CONTEXT
 from flowmpl.helpers import chart_title, legend_below
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _radius_to_px(
+    fig_w_in: float, ax_w_frac: float, xrange: float, dpi: float, corner_radius: float
+) -> float:
+    """Convert a horizontal data-unit length to pixels for a linear x axis.
+
+    Equivalent to differencing two ``transData`` points, without building
+    the transform.
+    """
+    return abs(corner_radius * fig_w_in * ax_w_frac * dpi / xrange)
+
+
+# Integer face codes used by the routing classifier, indexed into these tuples.
+_FACES = ("right", "left", "top", "bottom")
+_FACE_CODE = {f: i for i, f in enumerate(_FACES)}
+_FACE_ANGLE = np.array([0, 180, 90, -90])
+# Travel direction when arriving *at* a face — the opposite of its outward angle.
+_ARRIVAL_ANGLE = np.array([180, 0, -90, 90])
+
+# Below this many edges the NumPy classifier wins over a Numba call.
+_ROUTE_KERNEL_MIN_EDGES = 200
+
+
+def _route_faces_loop(
+    vx: np.ndarray, vy: np.ndarray, min_arm: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scalar-loop routing classifier with the same contract as :func:`_route_faces`.
+
+    Only worth running once compiled by Numba; see :func:`_route_kernel`.
+    """
+    n = vx.shape[0]
+    exit_face = np.empty(n, dtype=np.int64)
+    entry_face = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        avx, avy = abs(vx[i]), abs(vy[i])
+        horiz_entry = avy < avx * 0.75
+        if avy < avx * 0.25:
+            horiz_exit = True
+        elif avx < avy * 0.25:
+            horiz_exit = False
+            horiz_entry = False
+        else:
+            horiz_exit = not horiz_entry and avx >= min_arm
+        if horiz_exit:
+            exit_face[i] = 0 if vx[i] >= 0 else 1
+        else:
+            exit_face[i] = 2 if vy[i] >= 0 else 3
+        if horiz_entry:
+            entry_face[i] = 1 if vx[i] >= 0 else 0
+        else:
+            entry_face[i] = 3 if vy[i] >= 0 else 2
+    return exit_face, entry_face
+
+
+@cache
+def _route_kernel() -> Callable[[np.ndarray, np.ndarray, float], tuple] | None:
+    """Compile :func:`_route_faces_loop` with Numba, or None if it is not installed."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_route_faces_loop)
+
+
+def _route_faces(
+    vx: np.ndarray, vy: np.ndarray, min_arm: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pick exit and entry faces for every edge from its centre-to-centre vector.
+
+    Implements the compass-sector heuristic in the module docstring, including
+    the fallback of steep elbows whose horizontal arm would be shorter than
+    *min_arm* to a straight top/bottom connection.
+
+    Parameters
+    ----------
+    vx, vy : ndarray, shape (E,)
+        Destination centre minus source centre.
+    min_arm : float
+        Shortest horizontal elbow arm, in data units.
+
+    Returns
+    -------
+    exit_face, entry_face : ndarray of int, shape (E,)
+        Codes into ``_FACES`` (0 right, 1 left, 2 top, 3 bottom).
+    """
+    if len(vx) >= _ROUTE_KERNEL_MIN_EDGES:
+        kernel = _route_kernel()
+        if kernel is not None:
+            return kernel(np.ascontiguousarray(vx), np.ascontiguousarray(vy), min_arm)
+
+    avx, avy = np.abs(vx), np.abs(vy)
+    near_h = avy < avx * 0.25
+    near_v = ~near_h & (avx < avy * 0.25)
+    horiz_entry = ~near_v & (avy < avx * 0.75)
+    horiz_exit = near_h | (~near_v & ~horiz_entry & (avx >= min_arm))
+    exit_face = np.where(horiz_exit, np.where(vx >= 0, 0, 1), np.where(vy >= 0, 2, 3))
+    entry_face = np.where(horiz_entry, np.where(vx >= 0, 1, 0), np.where(vy >= 0, 3, 2))
+    return exit_face, entry_face
+
+
+# Hidden Agg figure used only to measure label extents; created on first use
+# and shared by every flow_diagram call so each render skips renderer setup.
+_MEASURE_FIG: Figure | None = None
+
+
+@lru_cache(maxsize=2048)
+def _measure_text_px(
+    label: str,
+    fontsize: float,
+    fontweight: str,
+    linespacing: float,
+    dpi: float,
+    font: tuple[str, bool],
+) -> tuple[float, float]:
+    """Pixel ``(width, height)`` of one label, memoised.
+
+    *font* is the resolved font file and usetex flag; it is part of the key
+    only so that rcParams font changes invalidate earlier measurements.
+    """
+    global _MEASURE_FIG
+    if _MEASURE_FIG is None:
+        _MEASURE_FIG = Figure(figsize=(1, 1))
+        FigureCanvasAgg(_MEASURE_FIG)
+    if _MEASURE_FIG.dpi != dpi:
+        _MEASURE_FIG.set_dpi(dpi)
+    t = _MEASURE_FIG.text(
+        0, 0, label, ha="center", va="center",
+        fontsize=fontsize, fontweight=fontweight, linespacing=linespacing,
+    )
+    bb = t.get_window_extent(renderer=_MEASURE_FIG.canvas.get_renderer())
+    t.remove()
+    return bb.width, bb.height
+
+
+def _measure_text_extents(
+    labels: list[str], fontsize: float, fontweight: str, linespacing: float, dpi: float
+) -> np.ndarray:
+    """Return the pixel ``(width, height)`` of each label as an (N, 2) array.
+
+    Extents depend only on the text properties and dpi, not on where the
+    text sits, so they are measured off-screen on the shared figure and
+    repeated labels (within or across diagrams) are measured once.
+    """
+    font = (
+        findfont(FontProperties(size=fontsize, weight=fontweight)),
+        bool(mpl.rcParams["text.usetex"]),
+    )
+    return np.array(
+        [_measure_text_px(lbl, fontsize, fontweight, linespacing, dpi, font) for lbl in labels],
+        dtype=float,
+    ).reshape(-1, 2)
+
 
 def flow_diagram(
     nodes: dict[str, tuple[str, float, float, str, str]],
@@ -113,18 +276,22 @@ def flow_diagram(
     fig, ax = plt.subplots(figsize=figsize)
     fig.subplots_adjust(left=0.01, right=0.99, top=0.92, bottom=0.12)
 
-    if xlim is None:
-        xs = [v[1] for v in nodes.values()]
-        xlim = (min(xs) - 3.0, max(xs) + 3.0)
-    if ylim is None:
-        ys = [v[2] for v in nodes.values()]
-        ylim = (min(ys) - 1.2, max(ys) + 1.2)
+    if xlim is None or ylim is None:
+        _n_nodes = len(nodes)
+        _xs = np.fromiter((v[1] for v in nodes.values()), dtype=float, count=_n_nodes)
+        _ys = np.fromiter((v[2] for v in nodes.values()), dtype=float, count=_n_nodes)
+        if xlim is None:
+            xlim = (float(_xs.min()) - 3.0, float(_xs.max()) + 3.0)
+        if ylim is None:
+            ylim = (float(_ys.min()) - 1.2, float(_ys.max()) + 1.2)
 
     ax.set_xlim(*xlim)
     ax.set_ylim(*ylim)
     ax.axis("off")
 
-    # Pass 1 — draw text invisibly to measure real pixel extents
+    # Pass 1 — place text invisibly and measure its real pixel extents.
+    # Measurement happens on the shared off-screen figure, so the target
+    # figure never needs a renderer of its own here.
     _txt: dict[str, plt.Text] = {}
     for k, (lbl, cx, cy, _fc, tc) in nodes.items():
         _txt[k] = ax.text(
@@ -132,19 +299,17 @@ def flow_diagram(
             fontsize=_fs, fontweight="bold", linespacing=1.35,
             color=tc, alpha=0, zorder=4,
         )
-    fig.canvas.draw()
-    _ren = fig.canvas.get_renderer()
-    _inv = ax.transData.inverted()
-
-    # Convert each text's pixel bbox → data-coord half-widths / half-heights
-    _hw: dict[str, float] = {}
-    _hh: dict[str, float] = {}
-    for k, t in _txt.items():
-        bb = t.get_window_extent(renderer=_ren)
-        p0 = _inv.transform((bb.x0, bb.y0))
-        p1 = _inv.transform((bb.x1, bb.y1))
-        _hw[k] = abs(p1[0] - p0[0]) / 2 + pad
-        _hh[k] = abs(p1[1] - p0[1]) / 2 + pad
+    _px = _measure_text_extents(
+        [v[0] for v in nodes.values()], _fs, "bold", 1.35, fig.dpi
+    )
+
+    # Convert each text's pixel size → data-coord half-widths / half-heights.
+    # Both axes are linear, so sizes measured from the display origin map
+    # through one inverse transform for the whole diagram.
+    _data = ax.transData.inverted().transform(np.vstack([(0.0, 0.0), _px]))
+    _half = np.abs(_data[1:] - _data[0]) / 2 + pad
+    _hw: dict[str, float] = dict(zip(_txt, _half[:, 0].tolist()))
+    _hh: dict[str, float] = dict(zip(_txt, _half[:, 1].tolist()))
 
     # Normalize widths within each x-column so aligned nodes look uniform
     _col_keys: dict[float, list[str]] = {}
@@ -156,70 +321,72 @@ def flow_diagram(
             _hw[k] = _max_hw
 
     # ---- Auto-space tiers (edge-aware) ----
-    _ys_all = sorted(set(round(v[2], 6) for v in nodes.values()))
+    # Bucket nodes by tier (rounded y) once; the tier loop below only reads
+    # these lookups instead of rescanning every node per tier.
+    _tier_of = {k: round(v[2], 6) for k, v in nodes.items()}
+    _tier_nodes: dict[float, list[str]] = {}
+    for k, _y in _tier_of.items():
+        _tier_nodes.setdefault(_y, []).append(k)
+    _ys_all = sorted(_tier_nodes)
     if len(_ys_all) > 1:
+        _tier_hh = {_y: max(_hh[k] for k in _ks) for _y, _ks in _tier_nodes.items()}
         _dpu_y = (ylim[1] - ylim[0]) / figsize[1]
         _lbl_clearance = (_efs / 72) * _dpu_y * 3.0 + 0.5
 
-        _elhh: dict[int, float] = {}
-        for _ei, _e in enumerate(edges):
-            _elbl = _e.get("label", "")
-            if _elbl:
-                _enl = _elbl.count("\n") + 1
-                _elhh[_ei] = _enl * (_efs / 72) * _dpu_y * 1.35 / 2 + 0.05
-
-        _new_y: dict[float, float] = {_ys_all[0]: _ys_all[0]}
-        _y_changed = False
-        for _ti in range(1, len(_ys_all)):
-            _y_lo, _y_hi = _ys_all[_ti - 1], _ys_all[_ti]
-            _lo_nds = [k for k in nodes if round(nodes[k][2], 6) == _y_lo]
-            _hi_nds = [k for k in nodes if round(nodes[k][2], 6) == _y_hi]
-            _req = (max(_hh[k] for k in _hi_nds)
-                    + max(_hh[k] for k in _lo_nds)
-                    + _lbl_clearance)
-
-            for _ei, _e in enumerate(edges):
-                _es, _ed = _e["src"], _e["dst"]
-                _esy = round(nodes[_es][2], 6)
-                _edy = round(nodes[_ed][2], 6)
-                _crosses = (
-                    (_esy == _y_lo and _edy == _y_hi)
-                    or (_esy == _y_hi and _edy == _y_lo)
-                )
-                if not _crosses or _ei not in _elhh:
-                    continue
-                _evx = nodes[_ed][1] - nodes[_es][1]
-                _evy = nodes[_ed][2] - nodes[_es][2]
-                _fe = _e.get("exit")
-                _fn = _e.get("entry")
-                _near_vert = (
+        _tier_idx = {_y: _i for _i, _y in enumerate(_ys_all)}
+
+        # Per-edge geometry depends only on the edge, so work it out once:
+        # for each labelled, vertically routed edge record the tiers it joins
+        # and the vertical span its label needs between the two nodes.
+        # Only edges between adjacent tiers constrain a gap, so requirements
+        # are folded straight into a per-gap maximum keyed by the upper tier.
+        _edge_req: dict[int, float] = {}
+        for _e in [_e for _e in edges if _e.get("label")]:
+            _elbl = _e["label"]
+            _es, _ed = _e["src"], _e["dst"]
+            _evx = nodes[_ed][1] - nodes[_es][1]
+            _evy = nodes[_ed][2] - nodes[_es][2]
+            _fe = _e.get("exit")
+            _fn = _e.get("entry")
+            _near_vert = (
+                _fe is None and _fn is None
+                and abs(_evy) > 1e-9
+                and abs(_evx) < abs(_evy) * 0.25
+            )
+            _prim_vert = (
+                (_fe in ("top", "bottom") and _fn in ("left", "right"))
+                or (
                     _fe is None and _fn is None
-                    and abs(_evy) > 1e-9
-                    and abs(_evx) < abs(_evy) * 0.25
-                )
-                _prim_vert = (
-                    (_fe in ("top", "bottom") and _fn in ("left", "right"))
-                    or (
-                        _fe is None and _fn is None
-                        and not _near_vert
-                        and abs(_evx) > 1e-9
-                        and abs(_evy) >= abs(_evx) * 0.75
-                    )
+                    and not _near_vert
+                    and abs(_evx) > 1e-9
+                    and abs(_evy) >= abs(_evx) * 0.75
                 )
-                if not (_near_vert or _prim_vert):
-                    continue
-                _src_k = _es if _esy == _y_hi else _ed
-                _dst_k = _ed if _esy == _y_hi else _es
-                if _near_vert:
-                    _e_req = _hh[_src_k] + _hh[_dst_k] + 2 * _elhh[_ei] + 0.6
-                else:
-                    _e_req = _hh[_src_k] + 2 * _hh[_dst_k] + 2 * _elhh[_ei] + 0.2
-                _req = max(_req, _e_req)
-
-            _placed = _new_y[_y_lo] + max(_y_hi - _y_lo, _req)
-            _new_y[_y_hi] = _placed
-            if abs(_placed - _y_hi) > 1e-9:
-                _y_changed = True
+            )
+            if not (_near_vert or _prim_vert):
+                continue
+            _esi, _edi = _tier_idx[_tier_of[_es]], _tier_idx[_tier_of[_ed]]
+            if abs(_esi - _edi) != 1:
+                continue
+            _src_k, _dst_k = (_es, _ed) if _esi > _edi else (_ed, _es)
+            _elhh = (_elbl.count("\n") + 1) * (_efs / 72) * _dpu_y * 1.35 / 2 + 0.05
+            if _near_vert:
+                _e_req = _hh[_src_k] + _hh[_dst_k] + 2 * _elhh + 0.6
+            else:
+                _e_req = _hh[_src_k] + 2 * _hh[_dst_k] + 2 * _elhh + 0.2
+            _hi_i = max(_esi, _edi)
+            _edge_req[_hi_i] = max(_edge_req.get(_hi_i, _e_req), _e_req)
+
+        # Each gap only has to cover its own requirement, so the gaps are
+        # independent and tier positions are a running sum of them.
+        _ys_arr = np.array(_ys_all)
+        _hh_arr = np.array([_tier_hh[_y] for _y in _ys_all])
+        _req_arr = _hh_arr[1:] + _hh_arr[:-1] + _lbl_clearance
+        for _hi_i, _e_req in _edge_req.items():
+            _req_arr[_hi_i - 1] = max(_req_arr[_hi_i - 1], _e_req)
+        _gaps = np.maximum(np.diff(_ys_arr), _req_arr)
+        _placed_arr = np.add.accumulate(np.concatenate((_ys_arr[:1], _gaps)))
+        _new_y: dict[float, float] = dict(zip(_ys_all, _placed_arr.tolist()))
+        _y_changed = bool((np.abs(_placed_arr - _ys_arr) > 1e-9).any())
 
         # Cap total expansion
         if max_autoscale is not None and len(_ys_all) > 1:
@@ -241,123 +408,80 @@ def flow_diagram(
             figsize = (figsize[0], figsize[1] * _y_scale)
             fig.set_size_inches(*figsize)
             ax.set_ylim(*ylim)
-            nodes = {
-                k: (v[0], v[1], _new_y[round(v[2], 6)], v[3], v[4])
-                for k, v in nodes.items()
-            }
+            # Shallow copy so the caller's mapping is untouched, then replace
+            # only the nodes whose tier actually moved.
+            nodes = dict(nodes)
             for k, _t in _txt.items():
-                _t.set_position((nodes[k][1], nodes[k][2]))
+                v = nodes[k]
+                _ny = _new_y[_tier_of[k]]
+                if _ny != v[2]:
+                    nodes[k] = (v[0], v[1], _ny, v[3], v[4])
+                    _t.set_position((v[1], _ny))
 
     # Convert corner_radius from data units to display units
-    _t0 = ax.transData.transform((0.0, 0.0))
-    _t1 = ax.transData.transform((corner_radius, 0.0))
-    _rad_px = float(abs(_t1[0] - _t0[0]))
-
-    # Pass 2 — draw boxes behind text, then make text visible
+    _sp_pars = fig.subplotpars
+    _rad_px = _radius_to_px(
+        figsize[0], _sp_pars.right - _sp_pars.left,
+        xlim[1] - xlim[0], fig.dpi, corner_radius,
+    )
+
+    # Pass 2 — draw boxes behind text (as one collection), then make text visible
+    _boxes: list[mpatches.FancyBboxPatch] = []
     for k, (_lbl, cx, cy, fc, _tc) in nodes.items():
         ec = CONTEXT if fc == COLORS["background"] else "none"
         lw = 1.2 if fc == COLORS["background"] else 0
-        ax.add_patch(mpatches.FancyBboxPatch(
+        _boxes.append(mpatches.FancyBboxPatch(
             (cx - _hw[k], cy - _hh[k]),
             2 * _hw[k], 2 * _hh[k],
             boxstyle=f"round,pad={box_pad}",
-            facecolor=fc, edgecolor=ec, linewidth=lw, zorder=3,
+            facecolor=fc, edgecolor=ec, linewidth=lw,
         ))
-        _txt[k].set_alpha(1.0)
+    ax.add_collection(PatchCollection(_boxes, match_original=True, zorder=3), autolim=False)
+    for _t in _txt.values():
+        _t.set_alpha(1.0)
 
     # ---- Pass 1: compute compass-based routing for every edge ----
+    # Faces come from the vectorized sector classifier; single-sided forced
+    # faces then override them, and the arrow tip is placed just outside
+    # whichever face the edge finally enters.
+    _node_idx = {k: i for i, k in enumerate(nodes)}
+    _cxy = np.array([(v[1], v[2]) for v in nodes.values()], dtype=float)
+    _src_i = np.array([_node_idx[e["src"]] for e in edges], dtype=np.intp)
+    _dst_i = np.array([_node_idx[e["dst"]] for e in edges], dtype=np.intp)
+    _sx, _sy = _cxy[_src_i].T
+    _dx, _dy = _cxy[_dst_i].T
+    _exit_f, _entry_f = _route_faces(_dx - _sx, _dy - _sy, corner_radius * 1.5)
+    _exit_a = _FACE_ANGLE[_exit_f]
+    _entry_a = _ARRIVAL_ANGLE[_entry_f]
+
+    _forced_exit = np.array([_FACE_CODE.get(e.get("exit"), -1) for e in edges], dtype=np.intp)
+    _forced_entry = np.array([_FACE_CODE.get(e.get("entry"), -1) for e in edges], dtype=np.intp)
+    _fx, _fn = _forced_exit >= 0, _forced_entry >= 0
+    if _fx.any():
+        _exit_f = np.where(_fx, _forced_exit, _exit_f)
+        _exit_a = np.where(_fx, _FACE_ANGLE[_forced_exit], _exit_a)
+    if _fn.any():
+        _entry_f = np.where(_fn, _forced_entry, _entry_f)
+        _entry_a = np.where(_fn, _FACE_ANGLE[_forced_entry], _entry_a)
+
     _tip = box_pad + 0.01
-    _routes: list[dict] = []
-    for edge in edges:
-        src = edge["src"]
-        dst = edge["dst"]
-        sx, sy = nodes[src][1], nodes[src][2]
-        dx, dy = nodes[dst][1], nodes[dst][2]
-        vx, vy = dx - sx, dy - sy
-        x1, y1 = sx, sy
-
-        _forced_exit = edge.get("exit")
-        _forced_entry = edge.get("entry")
-        _face_angle = {"right": 0, "left": 180, "top": 90, "bottom": -90}
-
-        if abs(vy) < abs(vx) * 0.25:
-            # Near-horizontal: straight, side faces
-            if vx >= 0:
-                x2, y2 = dx - _hw[dst] - _tip, dy
-                _exit_angle = _entry_angle = 0
-                _entry_face, _exit_face = "left", "right"
-            else:
-                x2, y2 = dx + _hw[dst] + _tip, dy
-                _exit_angle = _entry_angle = 180
-                _entry_face, _exit_face = "right", "left"
-        elif abs(vx) < abs(vy) * 0.25:
-            # Near-vertical: straight, top/bottom faces
-            if vy >= 0:
-                x2, y2 = dx, dy - _hh[dst] - _tip
-                _exit_angle = _entry_angle = 90
-                _entry_face, _exit_face = "bottom", "top"
-            else:
-                x2, y2 = dx, dy + _hh[dst] + _tip
-                _exit_angle = _entry_angle = -90
-                _entry_face, _exit_face = "top", "bottom"
-        elif abs(vy) < abs(vx) * 0.75:
-            # Primarily horizontal: EXIT top/bottom of source, enter side of dest.
-            _exit_angle = 90 if vy >= 0 else -90
-            _exit_face = "top" if vy >= 0 else "bottom"
-            if vx >= 0:
-                x2, y2 = dx - _hw[dst] - _tip, dy
-                _entry_angle = 0
-                _entry_face = "left"
-            else:
-                x2, y2 = dx + _hw[dst] + _tip, dy
-                _entry_angle = 180
-                _entry_face = "right"
-        else:
-            # Primarily vertical: EXIT side of source, enter top/bottom of dest.
-            _exit_angle = 0 if vx >= 0 else 180
-            _exit_face = "right" if vx >= 0 else "left"
-            if vy >= 0:
-                x2, y2 = dx, dy - _hh[dst] - _tip
-                _entry_angle = 90
-                _entry_face = "bottom"
-            else:
-                x2, y2 = dx, dy + _hh[dst] + _tip
-                _entry_angle = -90
-                _entry_face = "top"
-
-            # Degenerate elbow: horizontal arm shorter than corner radius
-            if abs(x2 - x1) < corner_radius * 1.5:
-                if vy >= 0:
-                    x2, y2 = dx, dy - _hh[dst] - _tip
-                    _exit_angle = _entry_angle = 90
-                    _entry_face, _exit_face = "bottom", "top"
-                else:
-                    x2, y2 = dx, dy + _hh[dst] + _tip
-                    _exit_angle = _entry_angle = -90
-                    _entry_face, _exit_face = "top", "bottom"
-
-        # Apply single-sided forced face overrides (post-heuristic)
-        if _forced_exit is not None:
-            _exit_face = _forced_exit
-            _exit_angle = _face_angle[_forced_exit]
-        if _forced_entry is not None:
-            _entry_face = _forced_entry
-            _entry_angle = _face_angle[_forced_entry]
-            if _forced_entry == "left":
-                x2, y2 = dx - _hw[dst] - _tip, dy
-            elif _forced_entry == "right":
-                x2, y2 = dx + _hw[dst] + _tip, dy
-            elif _forced_entry == "top":
-                x2, y2 = dx, dy + _hh[dst] + _tip
-            else:  # bottom
-                x2, y2 = dx, dy - _hh[dst] - _tip
-
-        _routes.append({
-            "edge": edge, "src": src, "dst": dst,
+    _hw_d = np.array([_hw[k] for k in _node_idx])[_dst_i]
+    _hh_d = np.array([_hh[k] for k in _node_idx])[_dst_i]
+    _x2 = np.select([_entry_f == 1, _entry_f == 0], [_dx - _hw_d - _tip, _dx + _hw_d + _tip], _dx)
+    _y2 = np.select([_entry_f == 2, _entry_f == 3], [_dy + _hh_d + _tip, _dy - _hh_d - _tip], _dy)
+
+    _routes: list[dict] = [
+        {
+            "edge": edge, "src": edge["src"], "dst": edge["dst"],
             "x1": x1, "y1": y1, "x2": x2, "y2": y2,
-            "exit_angle": _exit_angle, "entry_angle": _entry_angle,
-            "entry_face": _entry_face, "exit_face": _exit_face,
-        })
+            "exit_angle": _ea, "entry_angle": _na,
+            "entry_face": _FACES[_nf], "exit_face": _FACES[_ef],
+        }
+        for edge, x1, y1, x2, y2, _ea, _na, _nf, _ef in zip(
+            edges, _sx.tolist(), _sy.tolist(), _x2.tolist(), _y2.tolist(),
+            _exit_a.tolist(), _entry_a.tolist(), _entry_f.tolist(), _exit_f.tolist(),
+        )
+    ]
 
     # ---- Pass 2: spread arrowheads / tails on shared faces ----
     _entry_buckets: dict[tuple, list[int]] = {}
@@ -367,46 +491,51 @@ def flow_diagram(
             _entry_buckets.setdefault((_r["dst"], _r["entry_face"]), []).append(_i)
             _exit_buckets.setdefault((_r["src"], _r["exit_face"]), []).append(_i)
 
+    # Far-end centre of every route, indexed like _routes, so the bucket
+    # sorts below are plain list lookups.
+    _src_xs, _src_ys = _cxy[_src_i].T.tolist()
+    _dst_xs, _dst_ys = _cxy[_dst_i].T.tolist()
+
     for (_nk, _face), _idxs in _entry_buckets.items():
         if len(_idxs) < 2:
             continue
         _n = len(_idxs)
-        _ndx, _ndy = nodes[_nk][1], nodes[_nk][2]
+        _ndx, _ndy = _cxy[_node_idx[_nk]].tolist()
         if _face in ("top", "bottom"):
-            _idxs.sort(key=lambda _ii: nodes[_routes[_ii]["src"]][1])
+            _idxs.sort(key=_src_xs.__getitem__)
             _sp = _hw[_nk] * 0.5
             _y2 = _ndy + _hh[_nk] + _tip if _face == "top" else _ndy - _hh[_nk] - _tip
-            for _k, _ii in enumerate(_idxs):
-                _routes[_ii]["x2"] = _ndx - _sp + 2 * _sp * _k / (_n - 1)
+            for _ii, _x2 in zip(_idxs, np.linspace(_ndx - _sp, _ndx + _sp, _n).tolist()):
+                _routes[_ii]["x2"] = _x2
                 _routes[_ii]["y2"] = _y2
         else:
-            _idxs.sort(key=lambda _ii: nodes[_routes[_ii]["src"]][2], reverse=True)
+            _idxs.sort(key=_src_ys.__getitem__, reverse=True)
             _sp = _hh[_nk] * 0.5
             _x2 = _ndx - _hw[_nk] - _tip if _face == "left" else _ndx + _hw[_nk] + _tip
-            for _k, _ii in enumerate(_idxs):
+            for _ii, _y2 in zip(_idxs, np.linspace(_ndy + _sp, _ndy - _sp, _n).tolist()):
                 _routes[_ii]["x2"] = _x2
-                _routes[_ii]["y2"] = _ndy + _sp - 2 * _sp * _k / (_n - 1)
+                _routes[_ii]["y2"] = _y2
 
     for (_nk, _face), _idxs in _exit_buckets.items():
         if len(_idxs) < 2:
             continue
         _n = len(_idxs)
-        _nsx, _nsy = nodes[_nk][1], nodes[_nk][2]
+        _nsx, _nsy = _cxy[_node_idx[_nk]].tolist()
         if _face in ("top", "bottom"):
-            _idxs.sort(key=lambda _ii: nodes[_routes[_ii]["dst"]][1])
+            _idxs.sort(key=_dst_xs.__getitem__)
             _sp = _hw[_nk] * 0.5
-            for _k, _ii in enumerate(_idxs):
-                _routes[_ii]["x1"] = _nsx - _sp + 2 * _sp * _k / (_n - 1)
+            for _ii, _x1 in zip(_idxs, np.linspace(_nsx - _sp, _nsx + _sp, _n).tolist()):
+                _routes[_ii]["x1"] = _x1
         else:
-            _idxs.sort(key=lambda _ii: nodes[_routes[_ii]["dst"]][2], reverse=True)
+            _idxs.sort(key=_dst_ys.__getitem__, reverse=True)
             _sp = _hh[_nk] * 0.5
-            for _k, _ii in enumerate(_idxs):
-                _routes[_ii]["y1"] = _nsy + _sp - 2 * _sp * _k / (_n - 1)
+            for _ii, _y1 in zip(_idxs, np.linspace(_nsy + _sp, _nsy - _sp, _n).tolist()):
+                _routes[_ii]["y1"] = _y1
 
     # ---- Pass 3: draw all edges ----
     for _r in _routes:
         edge = _r["edge"]
-        src, dst = _r["src"], _r["dst"]
+        src = _r["src"]
         lbl = edge.get("label", "")
         dashed = edge.get("dashed", False)
         curve = edge.get("curve", 0.0)
@@ -424,19 +553,17 @@ def flow_diagram(
         else:
             _conn = f"angle,angleA={_exit_angle},angleB={_entry_angle},rad={_rad_px:.0f}"
 
-        ax.annotate(
-            "",
-            xy=(x2, y2), xytext=(x1, y1),
-            arrowprops=dict(
-                arrowstyle="-|>",
-                color=color,
-                lw=1.8,
-                linestyle="--" if dashed else "solid",
-                connectionstyle=_conn,
-                mutation_scale=14,
-            ),
+        # A bare arrow patch: annotate("") would add an empty Text per edge.
+        ax.add_patch(mpatches.FancyArrowPatch(
+            (x1, y1), (x2, y2),
+            arrowstyle="-|>",
+            color=color,
+            lw=1.8,
+            linestyle="--" if dashed else "solid",
+            connectionstyle=_conn,
+            mutation_scale=14,
             zorder=2,
-        )
+        ))
         if lbl:
             if not _parallel and curve == 0:
                 if abs(_exit_angle) in (0, 180):
@@ -469,14 +596,12 @@ def flow_diagram(
                     _f1x, _f1y = x1, y1
                 if curve != 0:
                     # arc3 label at visual arc midpoint: B(0.5) = 0.25*P0 + 0.5*P1 + 0.25*P2
-                    _p0 = np.array([_f1x, _f1y])
-                    _p2 = np.array([x2, y2])
-                    _chord = _p2 - _p0
-                    _chord_len = np.linalg.norm(_chord)
-                    _perp = np.array([-_chord[1], _chord[0]]) / (_chord_len + 1e-9)
-                    _p1 = (_p0 + _p2) / 2 + curve * _chord_len * _perp
-                    _mid = 0.25 * _p0 + 0.5 * _p1 + 0.25 * _p2
-                    mx, my = float(_mid[0]), float(_mid[1])
+                    # with P1 = M + curve*L*perp, which collapses to M + 0.5*curve*L*perp.
+                    _cvx, _cvy = x2 - _f1x, y2 - _f1y
+                    _chord_len = (_cvx * _cvx + _cvy * _cvy) ** 0.5
+                    _k = 0.5 * curve * _chord_len / (_chord_len + 1e-9)
+                    mx = (_f1x + x2) / 2 - _k * _cvy
+                    my = (_f1y + y2) / 2 + _k * _cvx
                 else:
                     mx, my = (_f1x + x2) / 2, (_f1y + y2) / 2
             ax.text(
@@ -89,9 +89,10 @@ def diverging_bar(
     ax.invert_yaxis()
     ax.set_ylim(len(categories) - 0.5, -0.5)
 
+    pad = np.abs(deviations).max(initial=0.0) * 0.02
     for i, d in enumerate(deviations):
         ha = "left" if d >= 0 else "right"
-        offset = max(abs(deviations)) * 0.02 * (1 if d >= 0 else -1)
+        offset = pad if d >= 0 else -pad
         ax.text(
             d + offset, i, f"{d:+,.1f}",
             va="center", ha=ha, fontsize=FONTS["value_label"],
@@ -355,6 +356,7 @@ def lollipop(
             if 0 <= idx < len(colors):
                 colors[idx] = highlight_color
 
+    pad = max(values, default=0) * 0.02
     if orientation == "horizontal":
         for i, (pos, val) in enumerate(zip(positions, values)):
             ax.hlines(pos, 0, val, color=colors[i], linewidth=1.5)
@@ -367,7 +369,7 @@ def lollipop(
 
         for i, v in enumerate(values):
             ax.text(
-                v + max(values) * 0.02, i, f"{v:,.0f}",
+                v + pad, i, f"{v:,.0f}",
                 va="center", fontsize=FONTS["value_label"],
             )
     else:
@@ -380,7 +382,7 @@ def lollipop(
 
         for i, v in enumerate(values):
             ax.text(
-                i, v + max(values) * 0.02, f"{v:,.0f}",
+                i, v + pad, f"{v:,.0f}",
                 ha="center", va="bottom", fontsize=FONTS["value_label"],
             )
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
+from matplotlib.layout_engine import PlaceHolderLayoutEngine, TightLayoutEngine
 
 from flowmpl.design import COLORS, CONTEXT, FONTS, INK_LIGHT, LEGEND_DEFAULTS
 from flowmpl.design import RULE as _RULE
@@ -59,10 +60,11 @@ def focus_colors(
     ctx = context or CONTEXT
     if isinstance(focus, str):
         focus = {focus}
-    return [
-        color_map.get(item, ctx) if item in focus else ctx
-        for item in items
-    ]
+    elif not isinstance(focus, (set, frozenset)):
+        focus = frozenset(focus)  # lists/tuples: O(1) membership per item
+    # The conditional short-circuits, so context items never touch color_map.
+    get = color_map.get
+    return [get(item, ctx) if item in focus else ctx for item in items]
 
 
 def chart_title(
@@ -71,6 +73,7 @@ def chart_title(
     *,
     fontsize: int | None = None,
     color: str | None = None,
+    skip_layout: bool = False,
 ) -> None:
     """Add a subtle, left-aligned insight title to a figure.
 
@@ -87,6 +90,9 @@ def chart_title(
         Override default (FONTS["caption"]).
     color : str, optional
         Override default (COLORS["text_light"]).
+    skip_layout : bool
+        Don't re-run ``tight_layout``; for callers that lay the figure out
+        themselves.
     """
     fig.suptitle(
         title,
@@ -95,12 +101,19 @@ def chart_title(
         fontstyle="italic",
         x=0.02, ha="left",
     )
+    # Only figures without an active layout engine (or a tight one) are
+    # re-laid out. Constrained layout reserves room for the suptitle itself
+    # at draw time, and tight_layout would silently replace that engine.
+    engine = fig.get_layout_engine()
+    if engine is not None and not isinstance(
+        engine, (TightLayoutEngine, PlaceHolderLayoutEngine)
+    ):
+        return
+    if skip_layout:
+        return
     # Re-run layout so tight_layout accounts for the suptitle; without this
     # the suptitle overlaps the top of the axes area.
-    try:
-        fig.tight_layout(rect=[0, 0, 1, 0.94])
-    except Exception:
-        pass  # no-op if figure uses constrained_layout
+    fig.tight_layout(rect=[0, 0, 1, 0.94])
 
 
 def annotate_point(
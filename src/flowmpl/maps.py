@@ -6,12 +6,19 @@ Install via: pip install flowmpl[maps]
 
 from __future__ import annotations
 
-import io
+import os
+import shutil
+import tempfile
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import matplotlib.path as mpath
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import is_color_like, to_rgba_array
+from matplotlib.patches import PathPatch
 
 from flowmpl.design import COLORS, FIGSIZE, FONTS, SCATTER_DEFAULTS
 from flowmpl.helpers import chart_title
@@ -25,42 +32,205 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 _SHAPEFILE_DIR = Path(__file__).resolve().parent / "_data" / "cb_2024_us_state_20m"
+_SHAPEFILE_NAME = "cb_2024_us_state_20m.shp"
 _SHAPEFILE_URL = (
     "https://www2.census.gov/geo/tiger/GENZ2024/shp/cb_2024_us_state_20m.zip"
 )
+# Downloaded archive, kept zipped: GDAL reads the shapefile from inside it.
+_SHAPEFILE_ZIP = _SHAPEFILE_DIR.with_suffix(".zip")
+
+# Continental extent shown by us_scatter_map (lon_min, lat_min, lon_max, lat_max)
+_CONUS_BOUNDS = (-125.0, 24.0, -66.0, 50.0)
+# Boundary simplification tolerance in degrees (~2 km): well under a pixel
+# at map figure sizes, but it drops most of the 20m vertices.
+_SIMPLIFY_TOLERANCE = 0.02
 
 # FIPS codes for non-continental states/territories to exclude
-_EXCLUDE_FIPS = {
+_EXCLUDE_FIPS = frozenset({
     "02", "15", "60", "66", "69", "72", "78",  # AK, HI, AS, GU, MP, PR, VI
-}
+})
+# Same exclusion as an OGR SQL filter, so GDAL drops those rows before any
+# geometry is decoded.
+_EXCLUDE_WHERE = "STATEFP NOT IN ({})".format(
+    ", ".join(f"'{fips}'" for fips in sorted(_EXCLUDE_FIPS))
+)
+
+
+def _check_states_zip(path: Path) -> None:
+    """Raise ValueError unless *path* is a zip holding a complete shapefile."""
+    stem = Path(_SHAPEFILE_NAME).stem
+    try:
+        with zipfile.ZipFile(path) as zf:
+            for ext in (".shp", ".shx", ".dbf"):
+                # Direct central-directory lookups; other members are never visited.
+                try:
+                    empty = zf.getinfo(stem + ext).file_size == 0
+                except KeyError:
+                    empty = True
+                if empty:
+                    raise ValueError(f"Downloaded state boundaries are missing {stem}{ext}")
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Downloaded state boundaries are not a valid zip: {e}") from e
 
 
+def _download_states_zip() -> None:
+    """Fetch the Census state boundary archive to ``_SHAPEFILE_ZIP``."""
+    try:
+        import requests
+    except ImportError as e:
+        raise ImportError(
+            "Downloading state boundaries requires requests. "
+            "Install with: pip install flowmpl[maps]"
+        ) from e
+
+    _SHAPEFILE_ZIP.parent.mkdir(parents=True, exist_ok=True)
+    # Download beside the final path and rename into place only once
+    # the archive checks out: an interrupted or concurrent download
+    # never leaves a truncated zip that later runs would trust.
+    fd, tmp_name = tempfile.mkstemp(suffix=".partial", dir=_SHAPEFILE_ZIP.parent)
+    tmp = Path(tmp_name)
+    try:
+        with (
+            os.fdopen(fd, "wb") as fh,
+            requests.get(_SHAPEFILE_URL, timeout=60, stream=True) as resp,
+        ):
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, fh, length=64 * 1024)
+        _check_states_zip(tmp)
+        os.replace(tmp, _SHAPEFILE_ZIP)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
 def _get_states_gdf():
-    """Load continental US state boundaries, downloading if needed."""
+    """Load continental US state boundaries, downloading if needed.
+
+    Boundaries are clipped to the plotted extent and simplified below
+    display resolution once, then cached for the life of the process;
+    callers only read from the frame, so the same object is returned.
+    """
     try:
         import geopandas as gpd
-        import requests
     except ImportError as e:
         raise ImportError(
-            "us_scatter_map requires geopandas and requests. "
+            "us_scatter_map requires geopandas. "
             "Install with: pip install flowmpl[maps]"
         ) from e
 
-    shp_file = _SHAPEFILE_DIR / "cb_2024_us_state_20m.shp"
-    if not shp_file.exists():
-        resp = requests.get(_SHAPEFILE_URL, timeout=60)
-        resp.raise_for_status()
-        _SHAPEFILE_DIR.mkdir(parents=True, exist_ok=True)
-        _shapefile_dir_resolved = _SHAPEFILE_DIR.resolve()
-        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
-            for member in zf.namelist():
-                member_path = (_SHAPEFILE_DIR / member).resolve()
-                if not str(member_path).startswith(str(_shapefile_dir_resolved)):
-                    raise ValueError(f"Unsafe ZIP path rejected: {member}")
-            zf.extractall(_SHAPEFILE_DIR)
+    shp_file = _SHAPEFILE_DIR / _SHAPEFILE_NAME
+    if shp_file.exists():
+        source = str(shp_file)
+    else:
+        if not _SHAPEFILE_ZIP.exists():
+            _download_states_zip()
+        source = f"zip://{_SHAPEFILE_ZIP}!{_SHAPEFILE_NAME}"
+
+    # pyogrio (a geopandas>=1.0 dependency) reads every feature in one bulk
+    # C call, filtered and with only STATEFP besides the geometry.
+    gdf = gpd.read_file(
+        source, engine="pyogrio", columns=["STATEFP"], where=_EXCLUDE_WHERE
+    ).clip(_CONUS_BOUNDS)
+    gdf["geometry"] = gdf.geometry.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True)
+    return gdf
+
+
+@lru_cache(maxsize=1)
+def _get_states_path() -> tuple[mpath.Path, float]:
+    """All state outlines as one compound path, plus the map's y/x aspect ratio.
+
+    Converted once from the cached GeoDataFrame through shapely's ragged
+    array export: every ring becomes a MOVETO … CLOSEPOLY run in a single
+    contiguous vertex array, which Agg fills and strokes in one call.
+    """
+    import shapely
+
+    _, coords, offsets = shapely.to_ragged_array(_get_states_gdf().geometry.values)
+    ring_offsets = offsets[0]
+    codes = np.full(len(coords), mpath.Path.LINETO, dtype=mpath.Path.code_type)
+    codes[ring_offsets[:-1]] = mpath.Path.MOVETO
+    codes[ring_offsets[1:] - 1] = mpath.Path.CLOSEPOLY
+
+    # Same equirectangular correction GeoDataFrame.plot applies to lon/lat data.
+    mid_lat = (coords[:, 1].min() + coords[:, 1].max()) / 2
+    return mpath.Path(coords, codes), float(1 / np.cos(np.deg2rad(mid_lat)))
+
+
+def _draw_into_axes(
+    ax: plt.Axes,
+    lats: Sequence[float],
+    lons: Sequence[float],
+    colors: Sequence[str] | str,
+    sizes: Sequence[float] | float,
+    *,
+    alpha: float,
+    edgecolors: str,
+    linewidth: float,
+) -> None:
+    """Draw the state basemap and the scatter points into *ax*.
+
+    Every call wraps the same cached path in a new patch, so the vertex
+    data is shared between axes and figures while the artists are not.
+    """
+    states_path, aspect = _get_states_path()
+    # Kept as vectors: after simplification the outlines are only a few
+    # thousand vertices, cheaper to stroke than a cached raster is to resample
+    # (and rasterizing doubles PDF size).
+    ax.add_patch(PathPatch(
+        states_path,
+        facecolor=COLORS["background"], edgecolor=COLORS["muted"], linewidth=0.7,
+    ))
+    ax.set_aspect(aspect)
+
+    # Convert once at the boundary: float arrays and pre-parsed RGBA skip
+    # scatter's per-point conversion of Python lists and hex strings.
+    # Numeric values are left for scatter to colour-map, as before.
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    if (
+        not isinstance(colors, str)
+        and np.iterable(colors)
+        and all(map(is_color_like, colors))
+    ):
+        colors = to_rgba_array(colors)
+    ax.scatter(
+        lons, lats, c=colors, s=np.asarray(sizes, dtype=np.float64), alpha=alpha,
+        edgecolors=edgecolors, linewidth=linewidth, zorder=3,
+    )
+
+    ax.set_xlim(_CONUS_BOUNDS[0], _CONUS_BOUNDS[2])
+    ax.set_ylim(_CONUS_BOUNDS[1], _CONUS_BOUNDS[3])
+    ax.set_axis_off()
+
 
-    gdf = gpd.read_file(shp_file)
-    return gdf[~gdf["STATEFP"].isin(_EXCLUDE_FIPS)]
+def make_legend_spec(handles: list) -> dict:
+    """Build the ``ax.legend`` keyword arguments :func:`us_scatter_map` uses.
+
+    Compute this once and pass it as ``legend_spec=`` when rendering many
+    maps with the same legend, so labels and layout options aren't rebuilt
+    for every figure.
+
+    Parameters
+    ----------
+    handles : list
+        Matplotlib legend handles; their labels become the legend entries.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for ``Axes.legend``.
+    """
+    return {
+        "handles": handles,
+        "labels": [h.get_label() for h in handles],
+        "loc": "upper center",
+        "bbox_to_anchor": (0.5, -0.03),
+        "ncol": min(len(handles), 5),
+        "fontsize": FONTS["legend"],
+        "frameon": False,
+        "markerscale": 1.3,
+    }
 
 
 def us_scatter_map(
@@ -71,6 +241,7 @@ def us_scatter_map(
     title: str,
     *,
     legend_handles: list | None = None,
+    legend_spec: dict | None = None,
     figsize: tuple[float, float] = FIGSIZE["map"],
     alpha: float = SCATTER_DEFAULTS["alpha"],
     edgecolors: str = "white",
@@ -92,6 +263,9 @@ def us_scatter_map(
         Insight-driven chart title.
     legend_handles : list, optional
         Matplotlib legend handles to display.
+    legend_spec : dict, optional
+        Precomputed result of :func:`make_legend_spec`; takes precedence
+        over *legend_handles*.
     figsize : tuple
         Figure size.
     alpha : float
@@ -105,33 +279,90 @@ def us_scatter_map(
     -------
     matplotlib.figure.Figure
     """
-    states = _get_states_gdf()
-
     fig, ax = plt.subplots(figsize=figsize)
-    states.plot(ax=ax, color=COLORS["background"], edgecolor=COLORS["muted"], linewidth=0.7)
-
-    ax.scatter(
-        lons, lats, c=colors, s=sizes, alpha=alpha,
-        edgecolors=edgecolors, linewidth=linewidth, zorder=3,
+    _draw_into_axes(
+        ax, lats, lons, colors, sizes,
+        alpha=alpha, edgecolors=edgecolors, linewidth=linewidth,
     )
 
-    ax.set_xlim(-125, -66)
-    ax.set_ylim(24, 50)
-    ax.set_axis_off()
+    if legend_spec is None and legend_handles:
+        legend_spec = make_legend_spec(legend_handles)
+    if legend_spec:
+        ax.legend(**legend_spec)
+        # The legend hangs below the axes in axes coordinates, so its space
+        # depends on the axes height: one extra solver pass lets that settle.
+        # Without a legend chart_title's own tight_layout pass is enough.
+        fig.tight_layout()
+
+    chart_title(fig, title)
+    return fig
+
+
+def us_scatter_maps(
+    panels: list[dict],
+    suptitle: str,
+    *,
+    ncols: int = 3,
+    figsize: tuple[float, float] | None = None,
+    alpha: float = SCATTER_DEFAULTS["alpha"],
+    edgecolors: str = "white",
+    linewidth: float = 0.5,
+) -> plt.Figure:
+    """Plot a grid of US scatter maps sharing one figure.
+
+    Cheaper than calling :func:`us_scatter_map` once per map: the figure and
+    layout are built once, and every panel reuses the same cached state
+    outlines.
+
+    Parameters
+    ----------
+    panels : list of dict
+        Each dict defines one map:
+        - "lats", "lons", "colors", "sizes": as for :func:`us_scatter_map`
+        - "title": str (optional)
+        - "legend_handles": list (optional)
+    suptitle : str
+        Overall figure title.
+    ncols : int
+        Number of columns in the map grid.
+    figsize : tuple, optional
+        Figure size. Defaults to (6*ncols, 3.5*nrows).
+    alpha : float
+        Point transparency.
+    edgecolors : str
+        Edge color for scatter points.
+    linewidth : float
+        Edge linewidth for scatter points.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+    """
+    nrows = int(np.ceil(len(panels) / ncols))
+    if figsize is None:
+        figsize = (6 * ncols, 3.5 * nrows)
 
-    if legend_handles:
-        labels = [h.get_label() for h in legend_handles]
-        ncol = min(len(legend_handles), 5)
-        ax.legend(
-            handles=legend_handles, labels=labels,
-            loc="upper center",
-            bbox_to_anchor=(0.5, -0.03),
-            ncol=ncol,
-            fontsize=FONTS["legend"],
-            frameon=False,
-            markerscale=1.3,
+    fig, axes = plt.subplots(nrows, ncols, figsize=figsize, squeeze=False)
+    title_fs = FONTS["panel_title"]
+    has_legend = False
+
+    for idx, panel in enumerate(panels):
+        row, col = divmod(idx, ncols)
+        ax = axes[row, col]
+        _draw_into_axes(
+            ax, panel["lats"], panel["lons"], panel["colors"], panel["sizes"],
+            alpha=alpha, edgecolors=edgecolors, linewidth=linewidth,
         )
+        ax.set_title(panel.get("title", ""), fontsize=title_fs)
+        if panel.get("legend_handles"):
+            ax.legend(**make_legend_spec(panel["legend_handles"]))
+            has_legend = True
 
-    plt.tight_layout()
-    chart_title(fig, title)
+    for idx in range(len(panels), nrows * ncols):
+        row, col = divmod(idx, ncols)
+        axes[row, col].set_visible(False)
+    if has_legend:
+        # Same extra solver pass as us_scatter_map: legends hang below the axes.
+        fig.tight_layout()
+    chart_title(fig, suptitle)
     return fig
@@ -7,8 +7,16 @@ general-purpose colorblind-safe categorical palette (Paul Tol).
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib.colors import to_rgba, to_rgba_array
+
 from flowmpl.design import COLORS
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
 # ───────────────────────────────────────────────────────────────────────────
 # Energy infrastructure — fuel / generation types
 # ───────────────────────────────────────────────────────────────────────────
@@ -84,20 +92,85 @@ CATEGORICAL: list[str] = [
 ]
 
 
+# ───────────────────────────────────────────────────────────────────────────
+# Pre-parsed RGBA forms of the palettes above, for hot loops and array
+# inputs (e.g. indexing CATEGORICAL_RGBA to build a scatter ``c=`` array)
+# without re-parsing hex strings on every render.
+# ───────────────────────────────────────────────────────────────────────────
+
+FUEL_RGBA: dict[str, tuple[float, float, float, float]] = {
+    k: to_rgba(v) for k, v in FUEL_COLORS.items()
+}
+COMPANY_RGBA: dict[str, tuple[float, float, float, float]] = {
+    k: to_rgba(v) for k, v in COMPANY_COLORS.items()
+}
+CATEGORICAL_RGBA: np.ndarray = to_rgba_array(CATEGORICAL).astype(np.float32)
+CATEGORICAL_RGBA.flags.writeable = False
+
+
 # ───────────────────────────────────────────────────────────────────────────
 # Lookup helpers
+#
+# These are called once per row by downstream code, so the bound dict
+# lookups are module-level names rather than a dict attribute load per call.
+# The bound methods still see later additions to the palette dicts.
 # ───────────────────────────────────────────────────────────────────────────
 
+_FUEL_GET = FUEL_COLORS.get
+_COMPANY_GET = COMPANY_COLORS.get
+_COMPANY_LABEL_GET = COMPANY_LABELS.get
+
+
 def fuel_color(fuel_type: str) -> str:
     """Return color for a fuel/generation type, with graceful fallback."""
-    return FUEL_COLORS.get(fuel_type, COLORS["muted"])
+    return _FUEL_GET(fuel_type, COLORS["muted"])
 
 
 def company_color(ticker: str) -> str:
     """Return brand color for a company ticker, with graceful fallback."""
-    return COMPANY_COLORS.get(ticker, COLORS["muted"])
+    return _COMPANY_GET(ticker, COLORS["muted"])
 
 
 def company_label(ticker: str) -> str:
     """Return display name for a company ticker."""
-    return COMPANY_LABELS.get(ticker, ticker)
+    return _COMPANY_LABEL_GET(ticker, ticker)
+
+
+def _lookup_many(
+    keys: Iterable[str], table: Mapping[str, str], default: str | None
+) -> np.ndarray:
+    """Map every key through *table*; misses get *default*, or the key if None."""
+    try:
+        import pandas as pd
+    except ImportError:
+        get = table.get
+        return np.array(
+            [get(k, k if default is None else default) for k in keys], dtype=object
+        )
+    # Factorize in C, then look up each distinct key once and broadcast back.
+    codes, uniques = pd.factorize(pd.Series(keys, copy=False))
+    get = table.get
+    values = np.array(
+        [get(k, k if default is None else default) for k in uniques] + [default],
+        dtype=object,
+    )
+    return values[codes]  # code -1 (missing key) picks the trailing default
+
+
+def fuel_colors_for(fuel_types: Iterable[str]) -> np.ndarray:
+    """Vectorized :func:`fuel_color`: one color per element of *fuel_types*.
+
+    Prefer this over calling :func:`fuel_color` per row of a DataFrame;
+    a Series or column can be passed directly.
+    """
+    return _lookup_many(fuel_types, FUEL_COLORS, COLORS["muted"])
+
+
+def company_colors_for(tickers: Iterable[str]) -> np.ndarray:
+    """Vectorized :func:`company_color`: one brand color per ticker."""
+    return _lookup_many(tickers, COMPANY_COLORS, COLORS["muted"])
+
+
+def company_labels_for(tickers: Iterable[str]) -> np.ndarray:
+    """Vectorized :func:`company_label`: one display name per ticker."""
+    return _lookup_many(tickers, COMPANY_LABELS, None)
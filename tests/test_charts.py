@@ -0,0 +1,36 @@
+"""Tests for flowmpl.charts."""
+
+from unittest import mock
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import to_rgba
+
+from flowmpl import charts
+from flowmpl.charts import _lttb_indices_loop, waterfall_chart
+
+
+def test_waterfall_chart_accepts_tuple_colors():
+    pos, neg, total = (0.1, 0.6, 0.2), (0.8, 0.1, 0.1, 0.9), (0.3, 0.3, 0.3)
+    fig = waterfall_chart(
+        [("a", 3.0), ("b", -1.0), ("c", 2.0)],
+        "Tuple colours",
+        positive_color=pos,
+        negative_color=neg,
+        total_color=total,
+    )
+    faces = [bar.get_facecolor() for bar in fig.axes[0].patches]
+    assert faces == [to_rgba(pos), to_rgba(neg), to_rgba(pos), to_rgba(total)]
+    plt.close(fig)
+
+
+def test_lttb_vectorized_matches_loop_kernel():
+    rng = np.random.default_rng(7)
+    # Includes sizes where float bucket edges would round differently.
+    for t, n_out in ((122, 24), (87, 37), (143, 107), (5003, 257), (5003, 1000)):
+        x = np.cumsum(rng.uniform(0.5, 1.5, t))
+        ys = np.cumsum(rng.normal(size=(3, t)), axis=1)
+        expected = _lttb_indices_loop(x, ys, n_out)
+        # Force the NumPy path even when Numba is installed.
+        with mock.patch.object(charts, "_lttb_kernel", return_value=None):
+            np.testing.assert_array_equal(charts._lttb_indices(x, ys, n_out), expected)